@@ -0,0 +1,15 @@
+import functools
+
+from config.settings import get_config, get_gemini_api_key
+
+@functools.cache
+def _configured_model(api_key: str, model_name: str):
+    """Configure the Gemini SDK and build the model once per (key, model) pair."""
+    import google.generativeai as genai
+    
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(model_name)
+
+def get_gemini_model():
+    """Return a configured Gemini model, built once and rebuilt only if the key or model changes."""
+    return _configured_model(get_gemini_api_key(), get_config().gemini_model)
@@ -1,29 +1,32 @@
-import os
-import google.generativeai as genai
 import json
+import re
+import sys
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment from project root
-load_dotenv(dotenv_path=Path(__file__).parent.parent / '.env')
+if __name__ == "__main__":
+    # Running the self-test as a script: put the project root (parent of AI/) on sys.path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from AI.gemini_client import get_gemini_model
+
+# orjson is optional; it raises a json.JSONDecodeError subclass so the
+# existing error handling works with either parser
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
 DIAGNOSTIC_MODE = False
 
+# Leading ```json / ``` and trailing ``` fences around Gemini JSON replies
+_FENCE_RE = re.compile(r"^```(?:json)?|```$")
+
 def analyze_match(resume_text: str, job_description: str) -> dict:
     """Core AI function: Compare resume to job description and return match analysis."""
     # Diagnostic mode disabled for production
     
-    # Verify API key
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key == "your_api_key_here":
-        raise Exception("GEMINI_API_KEY not configured")
-    
-    # Configure Gemini
-    try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-    except Exception as e:
-        raise
+    # Verify API key and configure Gemini (cached after the first call)
+    model = get_gemini_model()
     
     # Build analysis prompt
     prompt = f"""
@@ -84,19 +87,10 @@ def analyze_match(resume_text: str, job_description: str) -> dict:
         
         # Parse JSON response (strip markdown if present)
         try:
-            response_text = response.text.strip()
-            
             # Remove markdown code block markers
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]  # Remove ```json
-            if response_text.startswith("```"):
-                response_text = response_text[3:]  # Remove ```
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]  # Remove ```
-            
-            response_text = response_text.strip()
+            response_text = _FENCE_RE.sub("", response.text.strip()).strip()
             
-            result = json.loads(response_text)
+            result = _json.loads(response_text)
             return result
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse AI response as JSON: {e}")
@@ -106,17 +100,8 @@ def analyze_match(resume_text: str, job_description: str) -> dict:
 
 def extract_job_details(job_description: str) -> dict:
     """Extract job title and company name from job description using AI."""
-    # Verify API key
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key or api_key == "your_api_key_here":
-        raise Exception("GEMINI_API_KEY not configured")
-    
-    # Configure Gemini
-    try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.5-flash')
-    except Exception as e:
-        raise
+    # Verify API key and configure Gemini (cached after the first call)
+    model = get_gemini_model()
     
     # Build extraction prompt
     prompt = f"""
@@ -141,19 +126,10 @@ def extract_job_details(job_description: str) -> dict:
         
         # Parse JSON response (strip markdown if present)
         try:
-            response_text = response.text.strip()
-            
             # Remove markdown code block markers
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]  # Remove ```json
-            if response_text.startswith("```"):
-                response_text = response_text[3:]  # Remove ```
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]  # Remove ```
-            
-            response_text = response_text.strip()
+            response_text = _FENCE_RE.sub("", response.text.strip()).strip()
             
-            result = json.loads(response_text)
+            result = _json.loads(response_text)
             return result
         except json.JSONDecodeError as e:
             # If JSON parsing fails, return defaults
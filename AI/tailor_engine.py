@@ -1,5 +1,11 @@
-import os
-import google.generativeai as genai
+import sys
+from pathlib import Path
+
+if __name__ == "__main__":
+    # Running the self-test as a script: put the project root (parent of AI/) on sys.path
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from AI.gemini_client import get_gemini_model
 
 DIAGNOSTIC_MODE = False
 
@@ -18,16 +24,8 @@ def tailor_resume(resume_text: str, job_description: str, match_data: dict) -> s
         print(f"[DIAGNOSTIC] Resume length: {len(resume_text)} chars")
         print(f"[DIAGNOSTIC] Match score: {match_data.get('overall_score', 'N/A')}%")
     
-    # Verify API key
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        if DIAGNOSTIC_MODE:
-            print("[DIAGNOSTIC] ERROR: GEMINI_API_KEY not configured")
-        raise Exception("GEMINI_API_KEY not configured")
-    
-    # Configure Gemini with timeout
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash')
+    # Verify API key and configure Gemini (cached after the first call)
+    model = get_gemini_model()
     
     # Build tailoring prompt
     prompt = f"""
@@ -86,16 +84,8 @@ def generate_cover_letter(resume_text: str, job_description: str, match_data: di
     if DIAGNOSTIC_MODE:
         print(f"[DIAGNOSTIC] generate_cover_letter called")
     
-    # Verify API key
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        if DIAGNOSTIC_MODE:
-            print("[DIAGNOSTIC] ERROR: GEMINI_API_KEY not configured")
-        raise Exception("GEMINI_API_KEY not configured")
-    
-    # Configure Gemini with timeout
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.5-flash')
+    # Verify API key and configure Gemini (cached after the first call)
+    model = get_gemini_model()
     
     prompt = f"""
     Write a professional cover letter for this job using ONLY information from the resume.
@@ -188,7 +178,7 @@ if __name__ == "__main__":
     
     try:
         # Import match analyzer
-        from .match_analyzer import analyze_match
+        from AI.match_analyzer import analyze_match
         
         print("1. Analyzing match...")
         match_data = analyze_match(test_resume, test_job)
@@ -3,15 +3,123 @@
 Build script for CareerForge AI - Creates standalone executable with PyInstaller
 """
 
+import argparse
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
+import os
 import platform
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 
-def build_executable():
-    ROOT_DIR = Path(__file__).parent.resolve()
+@functools.lru_cache(maxsize=1)
+def _pyinstaller_version():
+    """Return the installed PyInstaller version, or None if it is missing"""
+    # Read the distribution metadata rather than importing PyInstaller itself
+    try:
+        return importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _pillow_available():
+    """Return True if Pillow is installed (without importing it)"""
+    return importlib.util.find_spec("PIL") is not None
+
+def check_environment():
+    """Verify the Python toolchain needed for the build"""
+    print(f" Verifying build environment...")
+    print("=" * 60)
+    
+    # Verify Python version
+    print(f" Python {sys.version.split()[0]}")
+    
+    # Verify PyInstaller
+    pyinstaller_version = _pyinstaller_version()
+    if pyinstaller_version is None:
+        print(" PyInstaller not found. Install with: pip install pyinstaller")
+        return False
+    print(f" PyInstaller {pyinstaller_version}")
+    
+    # Verify Pillow
+    if not _pillow_available():
+        print(" Pillow not found. Install with: pip install Pillow")
+        return False
+    print(f" Pillow (for icon conversion)")
+    
+    return True
+
+# Project inputs that end up in the bundle; a change in any of them triggers a rebuild
+HASHED_DIRS = ["AI", "assets", "config", "gui", "models", "prompts", "utils"]
+BUILD_HASH_FILE = Path("build") / ".jab_hash"
+DIST_DIR = Path("dist") / "CareerForgeAI"  # --onedir output the hash gate vouches for
+
+ICON_FILES = ("icon.png", "icon.ico", "icon.icns")
+
+def _scan_assets(assets_dir):
+    """Map each known icon file name to (path, size) with a single directory read"""
+    found = {}
+    try:
+        with os.scandir(assets_dir) as entries:
+            for entry in entries:
+                if entry.name in ICON_FILES:
+                    found[entry.name] = (Path(entry.path), entry.stat().st_size)
+    except FileNotFoundError:
+        pass
+    return found
+
+def _installed_packages():
+    """Python version plus every installed distribution as name==version.
+
+    PyInstaller bundles whatever third-party packages are installed, so upgrading any of them
+    (or the interpreter, PyInstaller or Pillow) must invalidate the cached build.
+    """
+    packages = sorted(f"{d.metadata['Name']}=={d.version}" for d in importlib.metadata.distributions())
+    return [sys.version] + packages
+
+def _compute_input_hash(root_dir, cmd):
+    """Hash the bundled sources, icons, config, the installed packages and the PyInstaller command line"""
+    digest = hashlib.sha256()
+    digest.update("\0".join(_installed_packages()).encode())
+    files = sorted(root_dir.glob("*.py"))
+    for name in HASHED_DIRS:
+        files.extend(sorted(p for p in (root_dir / name).rglob("*")
+                            if p.is_file() and "__pycache__" not in p.parts))
+    for path in files:
+        digest.update(str(path.relative_to(root_dir)).encode())
+        digest.update(path.read_bytes())
+    digest.update("\0".join(cmd).encode())
+    return digest.hexdigest()
+
+def build_executable(jobs=None):
+    """Build the standalone app; `jobs` caps parallelism of native compile steps"""
+    ROOT_DIR = Path(__file__).parent.absolute()  # absolute() needs no symlink-resolving syscalls
     MAIN_SCRIPT = ROOT_DIR / "gui" / "tkinter_app.py"
     
+    hidden_imports = [
+        "database",
+        "main",
+        "tailor",
+        "matcher",
+        "config.settings",
+        "config.prompt_manager",
+        "sqlalchemy",
+        "sqlalchemy.ext.declarative",
+        "jinja2",
+        "PIL",
+        "tkinter",
+    ]
+    
+    datas = [
+        f"{ROOT_DIR / 'config'}:config",
+        f"{ROOT_DIR / 'prompts'}:prompts",
+        f"{ROOT_DIR / 'assets'}:assets",
+        f"{ROOT_DIR / 'database'}:database",
+    ]
+    
     # Base PyInstaller command (cross-platform compatible)
     pyinstaller_cmd = [
         sys.executable, "-m", "PyInstaller",
@@ -22,23 +130,14 @@ def build_executable():
         "--clean",
         "--noconfirm",
         "--paths", str(ROOT_DIR),
-        "--hidden-import", "database",
-        "--hidden-import", "main",
-        "--hidden-import", "tailor",
-        "--hidden-import", "matcher",
-        "--hidden-import", "config.settings",
-        "--hidden-import", "config.prompt_manager",
-        "--hidden-import", "sqlalchemy",
-        "--hidden-import", "sqlalchemy.ext.declarative",
-        "--hidden-import", "jinja2",
-        "--hidden-import", "PIL",
-        "--hidden-import", "tkinter",
-        "--add-data", f"{ROOT_DIR / 'config'}:config",
-        "--add-data", f"{ROOT_DIR / 'prompts'}:prompts",
-        "--add-data", f"{ROOT_DIR / 'assets'}:assets",
-        "--add-data", f"{ROOT_DIR / 'database'}:database",
-        "--icon", str(ROOT_DIR / "assets" / "icon.icns"),
     ]
+    pyinstaller_cmd += [arg for imp in hidden_imports for arg in ("--hidden-import", imp)]
+    pyinstaller_cmd += [arg for data in datas for arg in ("--add-data", data)]
+    pyinstaller_cmd += ["--icon", str(ROOT_DIR / "assets" / "icon.icns")]
+    
+    # UPX compression is serial and dominates link time; opt in with JAB_BUILD_UPX=1
+    if os.environ.get("JAB_BUILD_UPX") != "1":
+        pyinstaller_cmd.append("--noupx")
     
     # Add splash screen only on non-macOS platforms
     if platform.system() != "Darwin":
@@ -48,26 +147,7 @@ def build_executable():
         else:
             print(f"  Splash screen not found at {splash_path}")
     
-    print(f" Verifying build environment...")
-    print("=" * 60)
-    
-    # Verify Python version
-    print(f" Python {sys.version.split()[0]}")
-    
-    # Verify PyInstaller
-    try:
-        import PyInstaller
-        print(f" PyInstaller {PyInstaller.__version__}")
-    except ImportError:
-        print(" PyInstaller not found. Install with: pip install pyinstaller")
-        return False
-    
-    # Verify Pillow
-    try:
-        import PIL
-        print(f" Pillow (for icon conversion)")
-    except ImportError:
-        print(" Pillow not found. Install with: pip install Pillow")
+    if not check_environment():
         return False
     
     # Verify main script
@@ -87,21 +167,59 @@ def build_executable():
         print("   (Users will need to create this themselves)")
     
     # Verify icon files
-    icon_dir = ROOT_DIR / "assets"
-    if (icon_dir / "icon.ico").exists():
-        print(f"    - Windows icon: {icon_dir / 'icon.ico'} ({(icon_dir / 'icon.ico').stat().st_size:,} bytes)")
-    if (icon_dir / "icon.icns").exists():
-        print(f"    - macOS icon: {icon_dir / 'icon.icns'} {(icon_dir / 'icon.icns').stat().st_size:,} bytes)")
+    icons = _scan_assets(ROOT_DIR / "assets")
+    if "icon.ico" in icons:
+        icon_path, icon_size = icons["icon.ico"]
+        print(f"    - Windows icon: {icon_path} ({icon_size:,} bytes)")
+    if "icon.icns" in icons:
+        icon_path, icon_size = icons["icon.icns"]
+        print(f"    - macOS icon: {icon_path} ({icon_size:,} bytes)")
     
     print("-" * 60)
     
+    # Skip PyInstaller entirely when nothing that goes into the bundle has changed
+    input_hash = _compute_input_hash(ROOT_DIR, pyinstaller_cmd)
+    if (BUILD_HASH_FILE.exists() and DIST_DIR.is_dir()
+            and BUILD_HASH_FILE.read_text().strip() == input_hash):
+        print(f" Build inputs unchanged - reusing existing ./{DIST_DIR.as_posix()} output")
+        print(f"   (Delete {BUILD_HASH_FILE} to force a rebuild)")
+        return True
+    
     # Run PyInstaller
     print(f"\n  Running PyInstaller...")
     print("=" * 60)
     print(f"   Running: {' '.join(pyinstaller_cmd)}\n")
     
     try:
-        result = subprocess.run(pyinstaller_cmd, check=True, capture_output=False)
+        env = os.environ.copy()
+        env.setdefault("PYTHONHASHSEED", "0")  # Reproducible bytecode across builds
+        
+        # Let any native extension compiled during the build use all requested cores
+        jobs = jobs or os.cpu_count() or 1
+        env["MAKEFLAGS"] = f"-j{jobs}"
+        env["CMAKE_BUILD_PARALLEL_LEVEL"] = str(jobs)
+        
+        with tempfile.TemporaryDirectory(prefix="careerforge-pyinstaller-") as config_dir:
+            # Per-build PyInstaller cache avoids contention between concurrent builds
+            env["PYINSTALLER_CONFIG_DIR"] = config_dir
+            
+            # Stream PyInstaller output line by line so long builds show progress
+            proc = subprocess.Popen(pyinstaller_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    bufsize=1, text=True, env=env)
+            try:
+                for line in proc.stdout:
+                    sys.stdout.write(line)
+            except KeyboardInterrupt:
+                proc.terminate()
+                proc.wait()
+                raise
+            returncode = proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, pyinstaller_cmd)
+        
+        BUILD_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BUILD_HASH_FILE.write_text(input_hash)
+        
         print("\n" + "=" * 60)
         print(" Build completed successfully!")
         print("=" * 60)
@@ -127,5 +245,10 @@ def build_executable():
         return False
 
 if __name__ == "__main__":
-    success = build_executable()
+    parser = argparse.ArgumentParser(description="Build the CareerForge AI standalone executable")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count(),
+                        help="Parallel jobs for native compile steps (default: CPU count)")
+    args = parser.parse_args()
+    
+    success = build_executable(jobs=args.jobs)
     sys.exit(0 if success else 1)
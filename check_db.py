@@ -1,13 +1,21 @@
+import argparse
 import sqlite3
 from config.settings import DB_PATH
 
+parser = argparse.ArgumentParser(description="List job applications stored in the database")
+parser.add_argument('--limit', type=int, default=100, help="Maximum number of records to show (default: 100)")
+args = parser.parse_args()
+
 # Connect to the database
 conn = sqlite3.connect(DB_PATH)
-cursor = conn.execute('SELECT id, job_title, company_name, job_description_path FROM applications ORDER BY created_at DESC')
-rows = cursor.fetchall()
+conn.row_factory = sqlite3.Row
+cursor = conn.execute(
+    'SELECT id, job_title, company_name, job_description_path FROM applications ORDER BY created_at DESC LIMIT ?',
+    (args.limit,)
+)
 
 print("Applications in database:")
-for i, row in enumerate(rows):
-    print(f"Record {i+1}: ID={row[0]}, Title='{row[1]}', Company='{row[2]}', JobDescPath='{row[3]}'")
+for i, row in enumerate(cursor, 1):
+    print(f"Record {i}: ID={row['id']}, Title='{row['job_title']}', Company='{row['company_name']}', JobDescPath='{row['job_description_path']}'")
 
-conn.close()
\ No newline at end of file
+conn.close()
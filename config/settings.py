@@ -1,16 +1,181 @@
+import functools
+import logging
 import os
+import re
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Final
 
-load_dotenv(dotenv_path=Path(__file__).parent.parent / ".env")
+# Project root; in a PyInstaller build this is the folder holding the executable.
+# Decided once at import since sys.frozen never changes during a process.
+BASE_DIR: Final = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent.parent
+ENV_PATH: Final = BASE_DIR / ".env"
+DEFAULT_RESUME_PATH = Path(__file__).parent / "default_resume.txt"
 
-# AI Model Configuration
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
+# Google API keys are "AIza" followed by 35 URL-safe characters
+_GEMINI_KEY_LEN = 39
+_GEMINI_KEY_RE = re.compile(r'AIza[0-9A-Za-z_-]{35}')
 
-# Workflow Configuration - User sets based on risk tolerance
-MIN_MATCH_THRESHOLD = int(os.getenv("MIN_MATCH_THRESHOLD", "80"))  # Default 80%
+_DOTENV_LOADED = False
+
+
+# Inline comment after an unquoted value (python-dotenv strips whitespace + '#' onwards)
+_INLINE_COMMENT_RE = re.compile(r"\s+#.*")
+
+
+def _parse_dotenv(path):
+    """Parse a .env file with plain KEY=value lines.
+
+    Returns None when the file uses syntax this reader does not handle the way python-dotenv does
+    (escapes inside quotes, ${VAR} expansion, multi-line or oddly quoted values), so the caller can
+    defer to python-dotenv instead of loading a different value.
+    """
+    out = {}
+    try:
+        data = Path(path).read_text(encoding="utf-8-sig")  # tolerate a BOM (Notepad, PowerShell 5)
+    except (FileNotFoundError, IsADirectoryError):
+        return out
+    for line in data.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[7:].lstrip()
+        key, sep, raw_value = line.partition("=")
+        key, value = key.strip(), raw_value.strip()
+        if not sep or not key:
+            continue
+        if key[:1] in ("'", '"') or "${" in value:
+            return None  # quoted key or variable expansion
+        if value[:1] in ("'", '"'):
+            quote = value[0]
+            end = value.find(quote, 1)
+            if end == -1 or "\\" in value[1:end]:
+                return None  # multi-line value or escape sequences
+            rest = value[end + 1:].strip()
+            if rest and not rest.startswith("#"):
+                return None  # text after the closing quote
+            value = value[1:end]
+        else:
+            # Strip the comment before the whitespace so "KEY= # note" loads as an empty value
+            value = _INLINE_COMMENT_RE.sub("", raw_value).strip()
+        out[key] = value
+    return out
+
+
+def load_env_file(path, override=False):
+    """Load a .env file into os.environ; returns True if the file defined any variables (like load_dotenv)"""
+    values = _parse_dotenv(path)
+    if values is None:
+        try:
+            from dotenv import load_dotenv
+        except ImportError:
+            logging.warning("%s needs python-dotenv to parse (escapes, ${VAR} or multi-line values); "
+                            "install python-dotenv to load it", path)
+            return False
+        return load_dotenv(dotenv_path=path, override=override)
+    if not values:
+        return False
+    for key, value in values.items():
+        if override or key not in os.environ:
+            os.environ[key] = value
+    return True
+
+
+def ensure_dotenv():
+    """Load the project .env once per process (set DOTENV_RELOAD=1 to force a re-read)"""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED and not os.environ.get("DOTENV_RELOAD"):
+        return
+    load_env_file(ENV_PATH)
+    _DOTENV_LOADED = True
+
+
+DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
+DEFAULT_MIN_MATCH_THRESHOLD = "80"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Environment-driven settings, built once on first access"""
+    gemini_api_key: str = field(repr=False)  # AI Model Configuration; kept out of repr()
+    gemini_model: str
+    min_match_threshold: int  # Workflow Configuration - User sets based on risk tolerance
+
+    @classmethod
+    def from_env(cls, env):
+        """Parse settings from an environment mapping"""
+        return cls(
+            gemini_api_key=env.get("GEMINI_API_KEY", ""),
+            gemini_model=env.get("GEMINI_MODEL", DEFAULT_GEMINI_MODEL),
+            min_match_threshold=int(env.get("MIN_MATCH_THRESHOLD", DEFAULT_MIN_MATCH_THRESHOLD)),  # Default 80%
+        )
+
+
+@functools.cache
+def get_config():
+    """Load .env, snapshot the environment and build the Config on first access.
+
+    Nothing here runs at import, so modules that only need paths such as DB_PATH never read .env;
+    validation errors surface here rather than at import.
+    """
+    ensure_dotenv()
+    return Config.from_env(MappingProxyType(dict(os.environ)))
+
+
+# Legacy module-level names resolved lazily from get_config() (PEP 562)
+_CONFIG_ATTRS = {
+    "GEMINI_API_KEY": "gemini_api_key",
+    "GEMINI_MODEL": "gemini_model",
+    "MIN_MATCH_THRESHOLD": "min_match_threshold",
+}
+
+
+def __getattr__(name):
+    if name in _CONFIG_ATTRS:
+        return getattr(get_config(), _CONFIG_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Paths
 DB_PATH = Path("database/applications.db")
 OUTPUT_PATH = Path("output")
+
+@functools.cache
+def ensure_directories():
+    """Create the database directory once per process (skipped when JOBBOT_SKIP_FS_INIT=1)"""
+    if os.environ.get("JOBBOT_SKIP_FS_INIT") == "1":
+        return
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+
+def output_dir():
+    """Return OUTPUT_PATH, creating it on write so read-only sessions never touch it (and a deleted folder is recreated)"""
+    OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+    return OUTPUT_PATH
+
+
+def looks_like_gemini_key(key):
+    """Return True if `key` has the shape of a Google API key"""
+    # Length check first so obviously wrong values skip the regex
+    return bool(key) and len(key) == _GEMINI_KEY_LEN and _GEMINI_KEY_RE.fullmatch(key) is not None
+
+
+def get_gemini_api_key():
+    """Return GEMINI_API_KEY from the live environment, raising if it is unset or a placeholder.
+
+    Reads os.environ on every call (not the get_config() snapshot) because the GUI may load
+    an additional .env after startup.
+    """
+    ensure_dotenv()
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key or api_key == "your_api_key_here":
+        raise Exception("GEMINI_API_KEY not configured")
+    return api_key
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_resume_text():
+    """Return the bundled sample resume, read from disk on first use only"""
+    return DEFAULT_RESUME_PATH.read_text(encoding='utf-8')
@@ -4,17 +4,66 @@ from pathlib import Path
 from datetime import datetime
 from config.settings import DB_PATH, OUTPUT_PATH
 
+# Per-connection tuning: with WAL, synchronous=NORMAL avoids an fsync on every commit;
+# the rest keep temp data and hot pages in memory. (sqlite3.connect's default 5s timeout
+# already installs a busy handler, so busy_timeout is not repeated here.)
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# WAL lets reads run alongside the writer. The journal mode is stored in the database file,
+# so it only needs switching on the first connection to each database in a process.
+_WAL_ENABLED = set()
+
+
+def connect(db_path=DB_PATH):
+    """Open a SQLite connection to the application database with the shared PRAGMAs applied"""
+    conn = sqlite3.connect(db_path)
+    if db_path not in _WAL_ENABLED:
+        conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        _WAL_ENABLED.add(db_path)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def dict_factory(cursor, row):
+    """Row factory that builds plain dicts directly instead of sqlite3.Row + dict(row) per row"""
+    return dict(zip([column[0] for column in cursor.description], row))
+
+
 class DatabaseManager:
     def __init__(self):
         self.db_path = DB_PATH
+        self._conn = None
         self.init_database()
     
+    def _connection(self):
+        """Return this manager's connection, opened on first use and reused by every method.
+
+        Reuse keeps SQLite's page cache and sqlite3's prepared-statement cache warm between
+        calls. Like the GUI that owns the manager, it is only used from one thread.
+        """
+        if self._conn is None:
+            self._conn = connect(self.db_path)
+            self._conn.row_factory = dict_factory
+        return self._conn
+    
+    def close(self):
+        """Close the shared connection (it is reopened on next use)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def init_database(self):
         """Initialize the database with required tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             # Check if applications table exists and has match_score column
             cursor = conn.execute("PRAGMA table_info(applications)")
-            columns = [info[1] for info in cursor.fetchall()]
+            columns = [info['name'] for info in cursor.fetchall()]
             
             if 'match_score' not in columns:
                 # Need to add match_score column
@@ -108,11 +157,14 @@ class DatabaseManager:
                 )
             ''')
             
+            # get_all_applications() lists newest first; the index lets SQLite walk it instead of sorting
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_applications_created_at ON applications (created_at)')
+            
             conn.commit()
     
     def add_application(self, job_title, company_name, job_url, resume_path, cover_letter_path, job_description_path=None, match_score=0, match_summary=None):
         """Add a new job application"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             cursor = conn.execute('''
                 INSERT INTO applications (job_title, company_name, job_url, resume_path, cover_letter_path, job_description_path, match_score, match_summary)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -121,19 +173,23 @@ class DatabaseManager:
             conn.commit()
             return cursor.lastrowid
     
+    def iter_applications(self):
+        """Yield job applications newest first, one row at a time instead of building a list"""
+        yield from self._connection().execute('''
+            SELECT * FROM applications ORDER BY created_at DESC
+        ''')
+    
     def get_all_applications(self):
         """Get all job applications"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute('''
-                SELECT * FROM applications ORDER BY created_at DESC
-            ''')
-            
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_applications())
+    
+    def get_application(self, app_id):
+        """Get a single job application by id (None if it does not exist)"""
+        return self._connection().execute('SELECT * FROM applications WHERE id = ?', (app_id,)).fetchone()
     
     def update_application_status(self, app_id, status):
         """Update application status"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('''
                 UPDATE applications 
                 SET status = ?, updated_at = CURRENT_TIMESTAMP
@@ -144,6 +200,6 @@ class DatabaseManager:
     
     def delete_application(self, app_id):
         """Delete an application"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('DELETE FROM applications WHERE id = ?', (app_id,))
             conn.commit()
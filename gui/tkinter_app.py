@@ -10,7 +10,6 @@ import shutil
 import re
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
 import logging
 
 # Add project root to Python path
@@ -18,7 +17,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "utils"))
 
-from config.settings import OUTPUT_PATH, DB_PATH, MIN_MATCH_THRESHOLD
+from config.settings import ENV_PATH, OUTPUT_PATH, DB_PATH, MIN_MATCH_THRESHOLD, ensure_directories, get_default_resume_text, load_env_file, looks_like_gemini_key, output_dir
 import config.settings
 from database import DatabaseManager
 from tailor import process_and_tailor_from_gui
@@ -33,7 +32,7 @@ logging.basicConfig(
 
 class JobAppTkinter:
     def __init__(self, master=None):
-        print("MAIN FILE EXECUTED - UNIQUE IDENTIFIER")
+        logging.debug("JobAppTkinter initializing")
         
         # Apply themed style
         self.style = ttkthemes.ThemedStyle(master)
@@ -46,15 +45,15 @@ class JobAppTkinter:
         # Set window icon if available
         self._set_window_icon()
         
+        # Ensure the database directory exists (output/ is created on first write)
+        ensure_directories()
+        
         # Initialize models and database
         self.db_manager = DatabaseManager()
         self.resume_model = ResumeModel()
         self.selected_resume_path = None
         self.active_resume_id = None
         
-        # Ensure output directory exists
-        os.makedirs(OUTPUT_PATH, exist_ok=True)
-        
         # Create default resume if none exists
         self._ensure_default_resume()
         
@@ -120,75 +119,11 @@ class JobAppTkinter:
     
     def _ensure_default_resume(self):
         """Create default resume if no resumes exist in database"""
-        resumes = self.resume_model.list_resumes()
-        
-        if not resumes:
-            default_resume_text = """JOHN DOE
-AI Developer & Automation Specialist
-Louisville, KY | johndoe@example.com | (555) 123-4567 | linkedin.com/in/johndoe | github.com/johndoe
-
-PROFESSIONAL SUMMARY
-Strategic AI Designer and Orchestrator with expertise in architecting intelligent automation solutions and cross-platform applications. Proven track record of designing AI systems that improve efficiency by up to 85%. Strong background in AI strategy, solution architecture, and team leadership utilizing GPT APIs and modern AI platforms.
-
-CORE COMPETENCIES
-AI Strategy & Design: Solution architecture, system design, strategic planning
-AI Platforms & Tools: GPT-4 API, LangChain, cloud AI services, prompt engineering
-Leadership & Collaboration: Team guidance, stakeholder communication, project orchestration
-Business Alignment: Requirements translation, ROI optimization, outcome-focused design
-Process Optimization: Workflow automation, efficiency improvement, performance metrics
-Cross-Platform Solutions: Application design, deployment strategies, user experience
-
-PROFESSIONAL EXPERIENCE
-
-Lead AI Strategist | Tech Innovations Inc. | 2022-Present
-- Developed AI-powered resume tailoring system using GPT-4 API, reducing application time by 80%
-- Implemented cross-platform desktop application with PyInstaller for 500+ users
-- Created automated job application bot that increased interview rate by 3x
-- Led team of 3 developers in building machine learning pipeline
-
-Full Stack Developer | Automation Solutions Corp. | 2020-2022
-- Architected web scraping automation tools that processed 10,000+ job postings daily
-- Designed API integration strategy for LinkedIn, Indeed, and other platforms
-- Developed database architecture for candidate tracking and analytics
-- Directed cross-platform deployment strategy for Windows, macOS, and Linux
-
-AI Design Specialist | Machine Learning Startup | 2019-2020
-- Designed predictive models architecture for applicant tracking systems (ATS)
-- Created NLP solution framework for resume optimization
-- Built custom algorithm architecture for job matching and candidate ranking
-
-EDUCATION
-Bachelor of Science in Computer Science
-University of California, Berkeley | 2019
-Relevant Coursework: Machine Learning, AI Systems, Data Structures, Algorithms
-
-KEY PROJECTS
-CareerForge AI - AI Resume Tailorer
-- Designed intelligent resume tailoring system using GPT-4 API
-- Architected cross-platform solution for Windows, macOS, and Linux
-- Orchestrated development process with technical team
-
-Enterprise Automation Suite
-- Designed automation architecture for job search and application tracking
-- Directed integration with 15+ job boards via API and web services
-- Managed cross-platform deployment strategy
-
-AI Performance Optimizer
-- Designed machine learning model architecture for resume analysis
-- Created optimization framework for ATS performance and keyword targeting
-- Guided implementation with measurable 90% user satisfaction
-
-PROFESSIONAL DEVELOPMENT
-- Continuous learning in AI strategy and emerging technologies
-- Active participant in AI leadership and design communities
-- Member: AI Strategy Association, Technology Leadership Network
-
-REFERENCES
-Available upon request. Portfolio of designed solutions and architectural diagrams accessible via repository.
-"""
+        if not self.resume_model.has_resumes():
+            default_resume_text = get_default_resume_text()
             
             # Save to file
-            default_path = OUTPUT_PATH / "default_resume.txt"
+            default_path = output_dir() / "default_resume.txt"
             with open(default_path, 'w', encoding='utf-8') as f:
                 f.write(default_resume_text)
             
@@ -1131,7 +1066,7 @@ BEST PRACTICES:
                     text_content = re.sub(r'(\w+\.)\s+(\w+\s+\w+\s+\|\s+\w+\s+—\s+\w+,\s+KY\s+\|\s+\d{4}–\d{4})', r'\1\n\n\2', text_content)  # Fix specific pattern like "time. Network Infrastructure Architect | AccuCode — Louisville, KY | 2017–2018"
                     
                     # Save as text file
-                    txt_path = OUTPUT_PATH / f"{name}.txt"
+                    txt_path = output_dir() / f"{name}.txt"
                     with open(txt_path, 'w', encoding='utf-8') as f:
                         f.write(text_content)
                     
@@ -2337,9 +2272,8 @@ Format your response exactly as follows:
         for item in self.applications_tree.get_children():
             self.applications_tree.delete(item)
         
-        # Load applications from database
-        applications = self.db_manager.get_all_applications()
-        for app in applications:
+        # Stream applications from database straight into the tree
+        for app in self.db_manager.iter_applications():
             # Format date (handle both formats with and without microseconds)
             try:
                 # Try with microseconds first
@@ -2360,13 +2294,8 @@ Format your response exactly as follows:
         selection = self.applications_tree.selection()
         if selection:
             app_id = selection[0]
-            # Get application details
-            applications = self.db_manager.get_all_applications()
-            selected_app = None
-            for app in applications:
-                if str(app["id"]) == app_id:
-                    selected_app = app
-                    break
+            # Get application details (primary-key lookup instead of loading every row)
+            selected_app = self.db_manager.get_application(app_id)
             
             if selected_app:
                 # Store match score for export functionality
@@ -2786,20 +2715,20 @@ COVER LETTER
             base_name = f"{safe_company}_{safe_title}_{timestamp}"
             
             # Ensure output directory exists
-            OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+            output_path = output_dir()
             
             # Save tailored resume
-            resume_path = OUTPUT_PATH / f"{base_name}_resume.txt"
+            resume_path = output_path / f"{base_name}_resume.txt"
             with open(resume_path, 'w', encoding='utf-8') as f:
                 f.write(tailored_resume)
             
             # Save cover letter
-            cover_letter_path = OUTPUT_PATH / f"{base_name}_cover_letter.txt"
+            cover_letter_path = output_path / f"{base_name}_cover_letter.txt"
             with open(cover_letter_path, 'w', encoding='utf-8') as f:
                 f.write(cover_letter)
             
             # Save job description
-            job_description_path = OUTPUT_PATH / f"{base_name}_job_description.txt"
+            job_description_path = output_path / f"{base_name}_job_description.txt"
             with open(job_description_path, 'w', encoding='utf-8') as f:
                 f.write(job_description)
             
@@ -2955,20 +2884,23 @@ COVER LETTER
     
     def _check_api_key(self):
         """Check if Gemini API key is configured with robust path detection"""
-        # Try multiple possible .env locations
-        possible_paths = [
-            Path(__file__).parent.parent / ".env",  # Development path
+        # Try multiple possible .env locations; dict.fromkeys drops duplicates (e.g. when
+        # launched from the project root) so the same file is never read twice
+        possible_paths = dict.fromkeys([
+            ENV_PATH.absolute(),                    # Project root (next to the executable when frozen)
             Path.cwd() / ".env",                    # Current working directory
             Path.home() / ".job_application_bot.env",  # User home directory
-        ]
+        ])
         
         api_key = None
         for env_path in possible_paths:
-            if env_path.exists():
-                load_dotenv(dotenv_path=env_path)
+            # load_env_file() returns False for a missing (or empty) file, so no separate exists() probe
+            if load_env_file(env_path):
                 api_key = os.getenv("GEMINI_API_KEY")
                 if api_key and api_key != "your_api_key_here":
                     self._log_message(f"API key loaded from {env_path}", "info")
+                    if not looks_like_gemini_key(api_key):
+                        self._log_message("GEMINI_API_KEY does not look like a Google API key (expected 'AIza...')", "warning")
                     return  # Success, exit early
         
         # If we get here, no valid API key found
@@ -2984,21 +2916,21 @@ COVER LETTER
 
 def main():
     """Main entry point for the application"""
-    print("DEBUG: Starting application...")
+    logging.debug("Starting application...")
     root = tk.Tk()
-    print("DEBUG: Tk root created")
+    logging.debug("Tk root created")
     app = JobAppTkinter(root)
-    print("DEBUG: JobAppTkinter instantiated")
+    logging.debug("JobAppTkinter instantiated")
     root.mainloop()
-    print("DEBUG: Main loop ended")
+    logging.debug("Main loop ended")
 
 if __name__ == "__main__":
     try:
-        print("DEBUG: Entering main execution")
+        logging.debug("Entering main execution")
         main()
-        print("DEBUG: Exited main execution normally")
+        logging.debug("Exited main execution normally")
     except Exception as e:
         import traceback
-        print(f"DEBUG: Exception in main: {e}")
+        logging.error("Exception in main: %s", e)
         traceback.print_exc()
         input("Press Enter to continue...")
@@ -1,16 +1,30 @@
 from pathlib import Path
 from typing import List, Dict, Any
-import sqlite3
 from config.settings import DB_PATH
+from database import connect, dict_factory
 
 class ResumeModel:
     def __init__(self):
         self.db_path = DB_PATH
+        self._conn = None
         self._init_database()
     
+    def _connection(self):
+        """Return this model's connection, opened on first use and reused (same scheme as DatabaseManager)"""
+        if self._conn is None:
+            self._conn = connect(self.db_path)
+            self._conn.row_factory = dict_factory
+        return self._conn
+    
+    def close(self):
+        """Close the shared connection (it is reopened on next use)"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
     def _init_database(self):
         """Initialize resume table if not exists"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS resumes (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -20,45 +34,55 @@ class ResumeModel:
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            # Covers the active-resume lookup and the newest-first listing
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_resumes_is_active ON resumes (is_active)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_resumes_created_at ON resumes (created_at)')
             conn.commit()
     
     def add_resume(self, file_path: str, name: str, is_active: bool = False) -> int:
-        """Add a new resume to the database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('''
+        """Add a resume to the database, or update its name/active flag if the path is already stored"""
+        with self._connection() as conn:
+            # Upsert on the UNIQUE file_path instead of failing when the same file is added again
+            conn.execute('''
                 INSERT INTO resumes (name, file_path, is_active)
                 VALUES (?, ?, ?)
+                ON CONFLICT(file_path) DO UPDATE SET name = excluded.name, is_active = excluded.is_active
             ''', (name, file_path, 1 if is_active else 0))
             conn.commit()
-            return cursor.lastrowid
+            # lastrowid is not updated when the conflict branch runs, so look the id up by path
+            return conn.execute('SELECT id FROM resumes WHERE file_path = ?', (file_path,)).fetchone()['id']
     
     def list_resumes(self) -> List[Dict[str, Any]]:
         """List all resumes"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection() as conn:
             cursor = conn.execute('SELECT * FROM resumes ORDER BY created_at DESC')
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
+    
+    def has_resumes(self) -> bool:
+        """Return True if at least one resume is stored (stops at the first row)"""
+        with self._connection() as conn:
+            return conn.execute('SELECT 1 FROM resumes LIMIT 1').fetchone() is not None
     
     def get_active_resume(self) -> Dict[str, Any]:
         """Get the currently active resume"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connection() as conn:
             cursor = conn.execute('SELECT * FROM resumes WHERE is_active = 1 LIMIT 1')
-            result = cursor.fetchone()
-            return dict(result) if result else None
+            return cursor.fetchone()
     
     def set_active_resume_by_path(self, file_path: str):
         """Set a resume as active by file path"""
-        with sqlite3.connect(self.db_path) as conn:
-            # Deactivate all others
-            conn.execute('UPDATE resumes SET is_active = 0')
-            # Activate selected
-            conn.execute('UPDATE resumes SET is_active = 1 WHERE file_path = ?', (file_path,))
+        with self._connection() as conn:
+            # Activate the selected resume and deactivate the others in one statement,
+            # touching only rows whose flag actually changes
+            conn.execute('''
+                UPDATE resumes SET is_active = (file_path = ?)
+                WHERE is_active != (file_path = ?)
+            ''', (file_path, file_path))
             conn.commit()
     
     def delete_resume_by_path(self, file_path: str):
         """Delete a resume by file path"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connection() as conn:
             conn.execute('DELETE FROM resumes WHERE file_path = ?', (file_path,))
             conn.commit()
 
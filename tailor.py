@@ -1,38 +1,44 @@
-import os
+import functools
 import logging
 from pathlib import Path
-from typing import Optional, Dict, Any
-import google.generativeai as genai
-from jinja2 import Environment, FileSystemLoader, Template
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Final
 
-from config.settings import GEMINI_MODEL, OUTPUT_PATH
+from AI.gemini_client import get_gemini_model
+from config.settings import OUTPUT_PATH
 
-PROMPTS_DIR = Path(__file__).parent / "prompts" / "system"
+# Prompt locations are fixed for the process lifetime, so resolve them once
+PROMPTS_ROOT = Path(__file__).parent / "prompts"
+PROMPTS_DIR = PROMPTS_ROOT / "system"
+USER_PROMPTS_DIR = PROMPTS_ROOT / "user"
+
+# Shared Jinja2 environment per prompt folder keeps compiled templates cached between calls
+@functools.cache
+def _jinja_env(directory):
+    """Build the Jinja2 environment on first use (keeps the jinja2 import off the GUI startup path)."""
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader(str(directory)))
+
+# Map roles to template files (read-only view so callers cannot mutate the shared table)
+ROLE_TEMPLATE_MAP: Final = MappingProxyType({
+    "Standard": "system.txt.j2",
+    "Senior": "senior.txt.j2",
+    "Lead": "senior.txt.j2",
+    "Principal": "senior.txt.j2"
+})
 
 def load_prompt_template(role_level="Standard"):
     """Load Jinja2 prompt template for role level."""
-    env = Environment(loader=FileSystemLoader(str(PROMPTS_DIR)))
-    
-    # Map roles to template files
-    template_map = {
-        "Standard": "system.txt.j2",
-        "Senior": "senior.txt.j2",
-        "Lead": "senior.txt.j2",
-        "Principal": "senior.txt.j2"
-    }
-    
-    template_name = template_map.get(role_level, "system.txt.j2")
-    return env.get_template(template_name)
+    template_name = ROLE_TEMPLATE_MAP.get(role_level, "system.txt.j2")
+    return _jinja_env(PROMPTS_DIR).get_template(template_name)
 
 def load_user_prompt_template(prompt_name="custom_template.txt.j2"):
     """Load user-created prompt template."""
-    user_prompts_dir = PROMPTS_DIR / "user"
-    
-    if not (user_prompts_dir / prompt_name).exists():
+    if not (USER_PROMPTS_DIR / prompt_name).exists():
         return None
     
-    env = Environment(loader=FileSystemLoader(str(user_prompts_dir)))
-    return env.get_template(prompt_name)
+    return _jinja_env(USER_PROMPTS_DIR).get_template(prompt_name)
 
 def process_and_tailor_from_gui(resume_text, job_description, output_path, role_level="Standard", custom_prompt=None):
     """
@@ -74,14 +80,8 @@ def process_and_tailor_from_gui(resume_text, job_description, output_path, role_
         # Prompt length check removed for production
         
         # Initialize Gemini with timeout settings
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise Exception("GEMINI_API_KEY not found in environment")
-        
         # API initialization message removed for production
-        genai.configure(api_key=api_key)
-        
-        model = genai.GenerativeModel(GEMINI_MODEL)
+        model = get_gemini_model()
         
         # API call message removed for production
         # Add timeout to prevent hanging
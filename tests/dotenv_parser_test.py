@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+.env Parser Test
+Verify config.settings._parse_dotenv agrees with python-dotenv, or defers to it
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Point to project root (parent of tests/)
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from dotenv import dotenv_values
+from config.settings import _parse_dotenv
+
+# (case name, .env contents); each must parse exactly like dotenv_values or return None (fallback)
+CASES = [
+    ("comment lines", "# a comment\nA=1\n   # indented comment\n"),
+    ("export prefix", "export A=1\nexport   B=2\n"),
+    ("double quotes", 'A="two words"\n'),
+    ("single quotes", "A='two words'\n"),
+    ("hash inside quotes", "A='x#y'\nB=\"x # y\"\n"),
+    ("inline comment", "A=plain # comment\nB=a#b\nC=a\t#tab comment\nD=\"q\" # after quote\n"),
+    ("empty value", "A=\nB=''\n"),
+    ("spaces around =", "A = spaced\n"),
+    ("quote inside unquoted", 'A=a"b\n'),
+    ("UTF-8 BOM", "\ufeffA=1\n"),
+    ("comment-only value", "A= #x\nB=#x\n"),
+    ("empty key", "=b\nA=1\n"),
+    ("escaped quote", 'A="a\\"b"\n'),
+    ("escaped newline", 'A="line1\\nline2"\n'),
+    ("single-quote escape", "A='a\\'b'\n"),
+    ("variable expansion", "A=1\nB=${A}\n"),
+    ("multi-line value", 'A="line1\nline2"\n'),
+    ("text after quote", 'A="x" trailing\n'),
+]
+
+
+def test_parse_dotenv_matches_python_dotenv():
+    """Every case either matches dotenv_values or is handed to python-dotenv"""
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = Path(tmp) / ".env"
+        for name, contents in CASES:
+            env_file.write_text(contents, encoding="utf-8")
+            ours = _parse_dotenv(env_file)
+            if ours is None:
+                continue  # load_env_file() falls back to python-dotenv for this file
+            expected = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+            assert ours == expected, f"{name}: {ours!r} != {expected!r}"
+
+
+def test_escapes_fall_back_to_python_dotenv():
+    """Values python-dotenv would unescape must not be loaded by the simple reader"""
+    with tempfile.TemporaryDirectory() as tmp:
+        env_file = Path(tmp) / ".env"
+        for contents in ('A="a\\"b"\n', 'A="line1\\nline2"\n', "A='a\\'b'\n"):
+            env_file.write_text(contents, encoding="utf-8")
+            assert _parse_dotenv(env_file) is None, contents
+
+
+if __name__ == "__main__":
+    try:
+        test_parse_dotenv_matches_python_dotenv()
+        test_escapes_fall_back_to_python_dotenv()
+        print("SUCCESS: .env parser matches python-dotenv")
+        sys.exit(0)
+    except AssertionError as e:
+        print(f"TEST FAILED: {e}")
+        sys.exit(1)
@@ -7,9 +7,62 @@ Support for parsing job descriptions from various sources:
 """
 
 import re
+import sys
 from typing import Dict, Optional
 import json
 
+# Common skill keywords (read-only, so tuples rather than per-call lists)
+SKILL_KEYWORDS = (
+    'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'machine learning', 'ai', 'tensorflow', 'pytorch',
+    'html', 'css', 'angular', 'vue.js', 'spring', 'django', 'flask', 'rails',
+    'c++', 'c#', 'go', 'rust', 'scala', 'kotlin', 'swift', 'objective-c'
+)
+
+# Common benefit keywords
+BENEFIT_KEYWORDS = (
+    'health insurance', 'dental insurance', 'vision insurance', '401k', 'retirement plan',
+    'pto', 'paid time off', 'vacation', 'remote work', 'work from home',
+    'flexible hours', 'unlimited pto', 'stock options', 'bonus', 'competitive salary'
+)
+
+# (keyword, display name) pairs; the title-cased names are built and interned once so
+# every parsed job shares the same string objects instead of calling .title() per match
+_SKILL_TITLES = tuple((k, sys.intern(k.title())) for k in SKILL_KEYWORDS)
+_BENEFIT_TITLES = tuple((k, sys.intern(k.title())) for k in BENEFIT_KEYWORDS)
+
+# Patterns are compiled once at import rather than looked up in re's cache on every call
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_LINKEDIN_TITLE_RE = re.compile(r'<h1[^>]*>([^<]+)</h1>', re.IGNORECASE)
+_LINKEDIN_COMPANY_RE = re.compile(r'<span[^>]*class="topcard__flavor"[^>]*>([^<]+)</span>', re.IGNORECASE)
+_LINKEDIN_LOCATION_RE = re.compile(r'<span[^>]*class="topcard__flavor[^"]*topcard__flavor--bullet"[^>]*>([^<]+)</span>', re.IGNORECASE)
+_LINKEDIN_MARKUP_RE = re.compile(r'<div[^>]*class="show-more-less-html__markup"[^>]*>(.*?)</div>', re.DOTALL | re.IGNORECASE)
+
+_EMAIL_TITLE_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:job|position)[:\s]+(.+?)(?:\sat\s|$)',
+    r'(?:opening|opportunity)[:\s]+(.+?)(?:\sat\s|$)',
+    r'(?:hiring\s+for\s+)(.+?)(?:\s+position|$)'
+))
+_EMAIL_COMPANY_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'(?:at|@)\s+([A-Z][a-zA-Z\s&\-]+?)(?:\.|\n|$)',
+    r'(?:company|employer)[:\s]+([A-Z][a-zA-Z\s&\-]+?)(?:\.|\n|$)'
+))
+
+# "Position at Company" separator
+_AT_SPLIT_RE = re.compile(r'\s+(?:at|@)\s+', re.IGNORECASE)
+
+# Experience requirements (X+ years patterns)
+_EXPERIENCE_PATTERNS = tuple(re.compile(p) for p in (
+    r'(\d+)\s*\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
+    r'(?:experience|exp)\s+(?:of\s+)?(\d+)\s*\+?\s*(?:years?|yrs?)'
+))
+
+# Education requirements
+_EDUCATION_PATTERNS = tuple(re.compile(p) for p in (
+    r"(?:bachelor|master|ph\.?d|m\.?s|b\.?s)'?s?.*?(?:degree|in)",
+    r"(?:degree|diploma).*?(?:computer science|engineering|mathematics|statistics)",
+    r"(?:computer science|engineering|mathematics|statistics).*?(?:degree|diploma)"
+))
 
 def parse_linkedin_job_description(html_content: str) -> Dict[str, str]:
     """
@@ -36,17 +89,17 @@ def parse_linkedin_job_description(html_content: str) -> Dict[str, str]:
     }
     
     # Extract job title (simplified regex approach)
-    title_match = re.search(r'<h1[^>]*>([^<]+)</h1>', html_content, re.IGNORECASE)
+    title_match = _LINKEDIN_TITLE_RE.search(html_content)
     if title_match:
         job_data['title'] = title_match.group(1).strip()
     
     # Extract company name
-    company_match = re.search(r'<span[^>]*class="topcard__flavor"[^>]*>([^<]+)</span>', html_content, re.IGNORECASE)
+    company_match = _LINKEDIN_COMPANY_RE.search(html_content)
     if company_match:
         job_data['company'] = company_match.group(1).strip()
     
     # Extract location
-    location_match = re.search(r'<span[^>]*class="topcard__flavor[^"]*topcard__flavor--bullet"[^>]*>([^<]+)</span>', html_content, re.IGNORECASE)
+    location_match = _LINKEDIN_LOCATION_RE.search(html_content)
     if location_match:
         job_data['location'] = location_match.group(1).strip()
     
@@ -59,17 +112,17 @@ def parse_linkedin_job_description(html_content: str) -> Dict[str, str]:
             # Extract content between tags
             desc_section = html_content[desc_start:desc_end]
             # Remove HTML tags
-            clean_desc = re.sub(r'<[^>]+>', '', desc_section)
+            clean_desc = _HTML_TAG_RE.sub('', desc_section)
             job_data['description'] = clean_desc.strip()
     
     # If we couldn't extract description properly, try alternative approach
     if not job_data['description']:
         # Look for any large block of text that might be the description
-        desc_matches = re.findall(r'<div[^>]*class="show-more-less-html__markup"[^>]*>(.*?)</div>', html_content, re.DOTALL | re.IGNORECASE)
+        desc_matches = _LINKEDIN_MARKUP_RE.findall(html_content)
         if desc_matches:
             # Take the longest match as it's likely the full description
             longest_desc = max(desc_matches, key=len)
-            clean_desc = re.sub(r'<[^>]+>', '', longest_desc)
+            clean_desc = _HTML_TAG_RE.sub('', longest_desc)
             job_data['description'] = clean_desc.strip()
     
     return job_data
@@ -93,26 +146,15 @@ def parse_email_job_description(email_content: str) -> Dict[str, str]:
     }
     
     # Try to extract job title from subject line patterns
-    title_patterns = [
-        r'(?:job|position)[:\s]+(.+?)(?:\sat\s|$)',
-        r'(?:opening|opportunity)[:\s]+(.+?)(?:\sat\s|$)',
-        r'(?:hiring\s+for\s+)(.+?)(?:\s+position|$)'
-    ]
-    
-    for pattern in title_patterns:
-        title_match = re.search(pattern, email_content, re.IGNORECASE)
+    for pattern in _EMAIL_TITLE_PATTERNS:
+        title_match = pattern.search(email_content)
         if title_match:
             job_data['title'] = title_match.group(1).strip()
             break
     
     # Try to extract company name
-    company_patterns = [
-        r'(?:at|@)\s+([A-Z][a-zA-Z\s&\-]+?)(?:\.|\n|$)',
-        r'(?:company|employer)[:\s]+([A-Z][a-zA-Z\s&\-]+?)(?:\.|\n|$)'
-    ]
-    
-    for pattern in company_patterns:
-        company_match = re.search(pattern, email_content, re.IGNORECASE)
+    for pattern in _EMAIL_COMPANY_PATTERNS:
+        company_match = pattern.search(email_content)
         if company_match:
             job_data['company'] = company_match.group(1).strip()
             break
@@ -152,7 +194,7 @@ def parse_plain_text_job_description(text_content: str) -> Dict[str, str]:
             second_line = lines[1].strip()
             if ' at ' in second_line or ' @ ' in second_line:
                 # Extract company from "Position at Company" format
-                parts = re.split(r'\s+(?:at|@)\s+', second_line, re.IGNORECASE)
+                parts = _AT_SPLIT_RE.split(second_line)
                 if len(parts) > 1:
                     job_data['company'] = parts[-1]
     
@@ -183,52 +225,27 @@ def extract_job_requirements(description: str) -> Dict[str, list]:
     # Convert to lowercase for easier matching
     desc_lower = description.lower()
     
-    # Common skill keywords
-    skill_keywords = [
-        'python', 'java', 'javascript', 'react', 'node.js', 'sql', 'docker', 'kubernetes',
-        'aws', 'azure', 'gcp', 'machine learning', 'ai', 'tensorflow', 'pytorch',
-        'html', 'css', 'angular', 'vue.js', 'spring', 'django', 'flask', 'rails',
-        'c++', 'c#', 'go', 'rust', 'scala', 'kotlin', 'swift', 'objective-c'
-    ]
-    
     # Extract skills
-    for skill in skill_keywords:
+    for skill, title in _SKILL_TITLES:
         if skill in desc_lower:
-            requirements['skills'].append(skill.title())
+            requirements['skills'].append(title)
     
     # Extract experience requirements (X+ years patterns)
-    exp_patterns = [
-        r'(\d+)\s*\+?\s*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
-        r'(?:experience|exp)\s+(?:of\s+)?(\d+)\s*\+?\s*(?:years?|yrs?)'
-    ]
-    
-    for pattern in exp_patterns:
-        exp_matches = re.findall(pattern, desc_lower)
+    for pattern in _EXPERIENCE_PATTERNS:
+        exp_matches = pattern.findall(desc_lower)
         for match in exp_matches:
             requirements['experience'].append(f"{match}+ years experience")
     
     # Extract education requirements
-    edu_patterns = [
-        r"(?:bachelor|master|ph\.?d|m\.?s|b\.?s)'?s?.*?(?:degree|in)",
-        r"(?:degree|diploma).*?(?:computer science|engineering|mathematics|statistics)",
-        r"(?:computer science|engineering|mathematics|statistics).*?(?:degree|diploma)"
-    ]
-    
-    for pattern in edu_patterns:
-        edu_match = re.search(pattern, desc_lower)
+    for pattern in _EDUCATION_PATTERNS:
+        edu_match = pattern.search(desc_lower)
         if edu_match:
             requirements['education'].append(edu_match.group(0))
     
     # Extract benefits (simplified)
-    benefit_keywords = [
-        'health insurance', 'dental insurance', 'vision insurance', '401k', 'retirement plan',
-        'pto', 'paid time off', 'vacation', 'remote work', 'work from home',
-        'flexible hours', 'unlimited pto', 'stock options', 'bonus', 'competitive salary'
-    ]
-    
-    for benefit in benefit_keywords:
+    for benefit, title in _BENEFIT_TITLES:
         if benefit in desc_lower:
-            requirements['benefits'].append(benefit.title())
+            requirements['benefits'].append(title)
     
     return requirements
 